@@ -16,12 +16,357 @@ container.
 
 """
 import os
+import re
 import sys
 import json
+import time
+import atexit
+import sqlite3
 import requests
+import numpy as np
 #import cffinit
 import argparse
 import subprocess
+import unittest
+from unittest.mock import Mock, patch
+from urllib.parse import urlparse, quote, unquote
+from requests.adapters import HTTPAdapter
+
+# orjson decodes large API responses (e.g. /stats/contributors for a busy repository) several times faster than the
+# standard library, and can decode the raw response bytes directly, but fall back to json if it isn't installed
+try:
+    import orjson
+    _decode_json = orjson.loads
+except ImportError:
+    _decode_json = json.loads
+
+# a single shared session, so that the connections to api.github.com and pub.orcid.org are kept alive and reused,
+# rather than a new connection (and TLS handshake) being set up for every request
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+_SESSION.headers.update({
+    "Accept": "application/json",
+    "User-Agent": "autoCFF"
+})
+
+# a GitHub token, if one is available, raises the GitHub API rate limit from 60 to 5000 requests per hour.  When run as
+# a GitHub action, this can be supplied with `env: GITHUB_TOKEN: ${{ secrets.GITHUB_TOKEN }}`.
+GITHUB_TOKEN = os.environ.get("GITHUB_TOKEN")
+
+# when fewer than this many requests remain in the current rate limit window, we wait for the window to reset rather
+# than running into the limit.  If we do get rate limited, the request is retried (up to RATE_LIMIT_MAX_RETRIES times)
+# once the API says we can.  No single wait is longer than RATE_LIMIT_MAX_WAIT seconds.
+RATE_LIMIT_LOW_WATER = 10
+RATE_LIMIT_MAX_RETRIES = 3
+RATE_LIMIT_MAX_WAIT = 900
+
+# how long (in seconds) a response from each API is considered fresh.  GitHub data (e.g. contributor lists) can change
+# from push to push, whereas ORCID records change rarely, so these can be held on to for much longer.
+GITHUB_CACHE_TTL = 600
+ORCID_CACHE_TTL = 86400
+
+# persistent record of the ORCIDs resolved for each GitHub login, mapping login -> {"orcid": ..., "resolved_at": ...},
+# so that re-runs (e.g. on every push) don't repeat the whole search for contributors we've already looked up.  Unlike
+# the HTTP cache below, this is the one file that is meant to be kept between runs, either by committing it or by
+# caching it in the workflow.  Its location can be changed with the AUTOCFF_ORCID_CACHE environment variable.
+ORCID_CACHE_PATH = os.environ.get("AUTOCFF_ORCID_CACHE", ".autocff-orcid-cache.json")
+# how long (in seconds) a resolved ORCID (or the lack of one) is trusted before searching again: 30 days
+ORCID_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+# how many people are combined into a single ORCID search by search_orcid_bulk, which keeps the query URL to a
+# manageable length
+ORCID_BULK_SEARCH_SIZE = 50
+# how many results (at most) a search by name alone can return for us to still pick out a match by affiliation;
+# beyond this, the name is too common for an affiliation match to be trusted
+ORCID_MAX_NAMESAKES = 10
+
+try:
+    with open(ORCID_CACHE_PATH) as cache_file:
+        _orcid_cache = json.load(cache_file)
+except (OSError, ValueError):
+    _orcid_cache = {}
+_orcid_cache_modified = False
+
+def _save_orcid_cache():
+    """
+    This function writes the resolved ORCIDs back to disk, if any have been added since the cache was loaded.  It is
+    run automatically when the program exits.
+    """
+
+    if _orcid_cache_modified:
+        with open(ORCID_CACHE_PATH, "w") as cache_file:
+            json.dump(_orcid_cache, cache_file, indent=2, sort_keys=True)
+
+atexit.register(_save_orcid_cache)
+
+def _has_fresh_orcid(username):
+    """
+    This function checks whether the persistent cache holds a recent enough search result for a GitHub login.
+
+    Parameters
+    ----------
+    username : str
+        The GitHub username to check.
+
+    Returns
+    -------
+    is_fresh : bool
+        True if the login was resolved within ORCID_CACHE_MAX_AGE, False otherwise.
+    """
+
+    cached = _orcid_cache.get(username)
+    return cached is not None and time.time() - cached.get("resolved_at", 0) < ORCID_CACHE_MAX_AGE
+
+def _remember_orcid(username, orcid):
+    """
+    This function records the outcome of an ORCID search for a GitHub login in the persistent cache.
+
+    Parameters
+    ----------
+    username : str
+        The GitHub username that was searched for.
+    orcid : str
+        The ORCID link that was found, or None if none was found.
+
+    Returns
+    -------
+    orcid : str
+        The input ORCID, unchanged, so that this can wrap a return value.
+    """
+
+    global _orcid_cache_modified
+    _orcid_cache[username] = {"orcid": orcid, "resolved_at": int(time.time())}
+    _orcid_cache_modified = True
+    return orcid
+
+# pattern for an ORCID link, e.g. https://orcid.org/0000-0002-4321-2180
+_ORCID_RE = re.compile(r'\bhttps?://orcid\.org/\d{4}-\d{4}-\d{4}-\d{3}[0-9X]\b')
+
+# in-memory cache of decoded API responses, keyed by URL, holding (time fetched, decoded JSON)
+_response_cache = {}
+
+# running count of requests that did not succeed, so that a search can tell whether "nothing found" might only be
+# down to a failed (e.g. rate limited) request, rather than there genuinely being nothing to find
+_failed_request_count = 0
+
+# on-disk store of (ETag, JSON body, time stored) for each URL.  When a response has gone stale we send its ETag back
+# to the API, and a "304 Not Modified" reply (which GitHub does not count against the rate limit) lets us reuse the
+# stored body.  This is purely a scratch cache, so it lives in the user's own cache directory (or wherever
+# AUTOCFF_HTTP_CACHE points), and never in the repository being processed.  Bodies are stored as JSON in an sqlite
+# database, so that nothing in the store is ever unpickled.
+# Locally, the store carries over from run to run.  On a GitHub-hosted runner, however, the home directory starts out
+# empty for every job, so ETags are only reused between runs if AUTOCFF_HTTP_CACHE is pointed at a path which is saved
+# and restored with actions/cache (as with the ORCID cache above, but this one should not be committed).
+ETAG_CACHE_PATH = os.environ.get(
+    "AUTOCFF_HTTP_CACHE",
+    os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "autocff", "http-cache.sqlite"
+    )
+)
+# entries that haven't been fetched or revalidated for this long (in seconds) are dropped from the store: 7 days
+ETAG_CACHE_MAX_AGE = 7 * 24 * 60 * 60
+# the open store, or False if it couldn't be opened (or has since failed), in which case ETags simply aren't used
+_etag_store = None
+
+def _get_etag_store():
+    """
+    This function opens the on-disk ETag store on first use, dropping any entries older than ETAG_CACHE_MAX_AGE so that
+    the store doesn't grow without bound, and arranges for it to be closed when the program exits.  If the store can't
+    be opened (e.g. it is corrupt, or not writable), the ETag layer is turned off for the rest of the run.
+
+    Returns
+    -------
+    etag_store : sqlite3.Connection
+        The store, holding an "etags" table of (url, etag, body, stored_at) rows, or None if it is unavailable.
+    """
+
+    global _etag_store
+    if _etag_store is None:
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(ETAG_CACHE_PATH)), mode=0o700, exist_ok=True)
+            _etag_store = sqlite3.connect(ETAG_CACHE_PATH)
+            _etag_store.execute(
+                "CREATE TABLE IF NOT EXISTS etags (url TEXT PRIMARY KEY, etag TEXT, body TEXT, stored_at REAL)"
+            )
+            _etag_store.execute("DELETE FROM etags WHERE stored_at < ?", (time.time() - ETAG_CACHE_MAX_AGE,))
+            _etag_store.commit()
+            atexit.register(_etag_store.close)
+        except (OSError, sqlite3.Error) as error:
+            print(f"Warning: could not open the HTTP cache at {ETAG_CACHE_PATH} ({error}). Continuing without it.")
+            _etag_store = False
+    return _etag_store or None
+
+def _load_etag(url):
+    """
+    This function looks up the stored ETag and body for a URL.
+
+    Parameters
+    ----------
+    url : str
+        The API URL to look up.
+
+    Returns
+    -------
+    stored : tuple
+        The stored (ETag, decoded JSON) for the URL, or None if there isn't one (or the store is unavailable).
+    """
+
+    global _etag_store
+    etag_store = _get_etag_store()
+    if etag_store is None:
+        return None
+    try:
+        row = etag_store.execute("SELECT etag, body FROM etags WHERE url = ?", (url,)).fetchone()
+        return (row[0], json.loads(row[1])) if row is not None else None
+    except (sqlite3.Error, ValueError):
+        # the store is unusable, so stop using it, rather than failing every request
+        _etag_store = False
+        return None
+
+def _save_etag(url, etag, data):
+    """
+    This function stores (or refreshes) the ETag and body for a URL.
+
+    Parameters
+    ----------
+    url : str
+        The API URL the response is for.
+    etag : str
+        The ETag of the response.
+    data : dict or list
+        The decoded JSON body of the response.
+    """
+
+    global _etag_store
+    etag_store = _get_etag_store()
+    if etag_store is None:
+        return
+    try:
+        etag_store.execute(
+            "INSERT OR REPLACE INTO etags (url, etag, body, stored_at) VALUES (?, ?, ?, ?)",
+            (url, etag, json.dumps(data), time.time())
+        )
+        etag_store.commit()
+    except (sqlite3.Error, TypeError, ValueError):
+        _etag_store = False
+
+def _rate_limit_wait(response):
+    """
+    This function works out how long to wait before making another request, from the rate limit headers of a response.
+
+    Parameters
+    ----------
+    response : requests.Response
+        The response to inspect.
+
+    Returns
+    -------
+    wait : float
+        The number of seconds to wait, at most RATE_LIMIT_MAX_WAIT.
+    """
+
+    # "Retry-After" (sent with a 429) gives the wait directly, whereas "X-RateLimit-Reset" gives the time (in seconds
+    # since the epoch) at which the rate limit window resets
+    retry_after = response.headers.get("Retry-After")
+    reset = response.headers.get("X-RateLimit-Reset")
+    if retry_after is not None and retry_after.isdigit():
+        wait = int(retry_after)
+    elif reset is not None and reset.isdigit():
+        wait = int(reset) - time.time()
+    else:
+        wait = 1
+    return min(max(wait, 0), RATE_LIMIT_MAX_WAIT)
+
+def _rate_limited_get(url, headers=None):
+    """
+    This function makes a GET request with the shared session, only waiting between requests when the API's rate limit
+    headers say that it's necessary: retrying after the requested wait when rate limited, and waiting for the rate
+    limit to reset when close to running out.
+
+    Parameters
+    ----------
+    url : str
+        The URL to fetch.
+    headers : dict, optional
+        Any additional headers to send with the request.
+
+    Returns
+    -------
+    response : requests.Response
+        The response to the (last attempt at the) request.
+    """
+
+    for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+        response = _SESSION.get(url, headers=headers)
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        # GitHub signals an exhausted rate limit with a 403 and no remaining requests, rather than a 429, and its
+        # secondary rate limits with a 403 and a "Retry-After" header (while requests may still remain)
+        rate_limited = response.status_code == 429 or (
+            response.status_code == 403 and (remaining == "0" or "Retry-After" in response.headers)
+        )
+        if not rate_limited:
+            # if we're nearly out of requests, wait for the limit to reset now, rather than hitting it later
+            if remaining is not None and remaining.isdigit() and int(remaining) < RATE_LIMIT_LOW_WATER:
+                time.sleep(_rate_limit_wait(response))
+            return response
+        if attempt < RATE_LIMIT_MAX_RETRIES:
+            time.sleep(_rate_limit_wait(response))
+    return response
+
+def _get_json(url, headers=None):
+    """
+    This function fetches a URL from the GitHub or ORCID API and returns the decoded JSON body, caching the result
+    so that repeated requests for the same URL (e.g. the same user across several lookups) only hit the network once
+    within the cache lifetime.
+
+    Parameters
+    ----------
+    url : str
+        The API URL to fetch.
+    headers : dict, optional
+        Any additional headers to send with the request.
+
+    Returns
+    -------
+    data : dict or list
+        The decoded JSON body of the response, or None if the request did not succeed.
+    """
+
+    global _failed_request_count
+    host = urlparse(url).netloc
+    ttl = ORCID_CACHE_TTL if host == "pub.orcid.org" else GITHUB_CACHE_TTL
+
+    # if we have a fresh enough copy of this response, just return that
+    cached = _response_cache.get(url)
+    if cached is not None and time.time() - cached[0] < ttl:
+        return cached[1]
+
+    # otherwise, if we have seen this URL before, ask the API whether it has changed since then
+    stored = _load_etag(url)
+    request_headers = dict(headers) if headers is not None else {}
+    if stored is not None:
+        request_headers["If-None-Match"] = stored[0]
+    # the token is only sent to GitHub itself, and never to ORCID
+    if GITHUB_TOKEN and host == "api.github.com":
+        request_headers["Authorization"] = f"token {GITHUB_TOKEN}"
+
+    response = _rate_limited_get(url, headers=request_headers)
+    if response.status_code == 304 and stored is not None:
+        # unchanged, so the stored body is still current (and the entry is kept from being pruned)
+        data = stored[1]
+        _save_etag(url, stored[0], data)
+    elif response.status_code == 200:
+        data = _decode_json(response.content)
+        etag = response.headers.get("ETag")
+        if etag is not None:
+            _save_etag(url, etag, data)
+    else:
+        # only successful responses are cached, so that transient failures are retried on the next call
+        _failed_request_count += 1
+        return None
+
+    _response_cache[url] = (time.time(), data)
+    return data
 
 def getTargetRepositoryDetails(repositoryPath):
     """
@@ -43,81 +388,129 @@ def getTargetRepositoryDetails(repositoryPath):
     repositoryOwner = repositoryPath.split("/")[-2]
 
     # Get the repository details from the GitHub API.
-    repositoryDetails = requests.get("https://api.github.com/repos/" + repositoryOwner + "/" + repositoryName).json()
+    repositoryDetails = _get_json("https://api.github.com/repos/" + repositoryOwner + "/" + repositoryName)
 
     return repositoryDetails
 
 def get_repository_contributors(owner, repo):
-    import requests
-    contributors_url = f"https://api.github.com/repos/{owner}/{repo}/contributors"
-    response = requests.get(contributors_url)
+    # the contributors endpoint is paginated (30 per page by default), so request the largest page size GitHub allows
+    # and keep going until a short (or failed) page tells us we've reached the end
+    contributors_data = []
+    page = 1
+    while True:
+        contributors_url = f"https://api.github.com/repos/{owner}/{repo}/contributors?per_page=100&page={page}"
+        page_data = _get_json(contributors_url)
+        if not page_data:
+            break
+        contributors_data.extend(page_data)
+        if len(page_data) < 100:
+            break
+        page += 1
     
     contributors = []
-    if response.status_code == 200:
-        contributors_data = response.json()
-        
+    if contributors_data:
+
+        # Retrieve the contribution statistics once for the whole repository, rather than once per contributor,
+        # as the endpoint returns the same payload (covering every contributor) each time it is called
+        contributor_stats_url = f"https://api.github.com/repos/{owner}/{repo}/stats/contributors"
+        stats_data = _get_json(contributor_stats_url)
+
+        # index the statistics by login so that each contributor can be matched directly
+        stats_by_login = {}
+        if stats_data is not None:
+            for stats in stats_data:
+                if stats.get("author") is not None:
+                    stats_by_login[stats.get("author").get("login")] = stats
+
         for contributor_data in contributors_data:
             contributor = {
                 "login": contributor_data.get("login"),
                 "contributions": contributor_data.get("contributions"),
                 "contributed_dates": []
             }
-            
-            # Retrieve contribution statistics for each contributor
-            contributor_stats_url = f"https://api.github.com/repos/{owner}/{repo}/stats/contributors"
-            stats_response = requests.get(contributor_stats_url)
-            
-            if stats_response.status_code == 200:
-                stats_data = stats_response.json()
-                for stats in stats_data:
-                    if stats.get("author").get("login") == contributor["login"]:
-                        # Calculate the total volume of code contributions
-                        total_additions = sum(week.get("a", 0) for week in stats.get("weeks"))
-                        total_deletions = sum(week.get("d", 0) for week in stats.get("weeks"))
-                        total_changes = total_additions + total_deletions
-                        
-                        contributor["volume"] = total_changes
-                        
-                        # Retrieve the dates of contributions
-                        contributor["contributed_dates"] = [
-                            week.get("w") for week in stats.get("weeks") if week.get("a") or week.get("d")
-                        ]
-                        break
+
+            stats = stats_by_login.get(contributor["login"])
+            if stats is not None:
+                # pull the weekly additions, deletions, and week timestamps out into arrays in a single pass each,
+                # so that the totals and dates below are computed in numpy rather than by looping in python
+                weeks = stats.get("weeks")
+                additions = np.fromiter((week.get("a", 0) for week in weeks), dtype=np.int64, count=len(weeks))
+                deletions = np.fromiter((week.get("d", 0) for week in weeks), dtype=np.int64, count=len(weeks))
+                week_starts = np.fromiter((week.get("w") for week in weeks), dtype=np.int64, count=len(weeks))
+
+                # Calculate the total volume of code contributions
+                total_changes = int(additions.sum() + deletions.sum())
+
+                contributor["volume"] = total_changes
+
+                # Retrieve the dates of contributions
+                contributor["contributed_dates"] = week_starts[(additions != 0) | (deletions != 0)].tolist()
 
             contributors.append(contributor)
     
     return contributors
 
+def _user_json(username):
+    """
+    This function fetches a GitHub user's profile.  As this goes through _get_json, the several lookups made for the
+    same user within a run only hit the network once, while a failed lookup is retried the next time it's needed.
+
+    Parameters
+    ----------
+    username : str
+        The GitHub username to fetch.
+
+    Returns
+    -------
+    user_data : dict
+        The decoded /users/{username} response, or None if the request did not succeed.
+    """
+
+    return _get_json(f"https://api.github.com/users/{username}")
+
+def _social_accounts_json(username):
+    """
+    This function fetches the social accounts a GitHub user has listed on their profile, cached in the same way as
+    _user_json.
+
+    Parameters
+    ----------
+    username : str
+        The GitHub username to fetch.
+
+    Returns
+    -------
+    social_accounts_data : list
+        The decoded /users/{username}/social_accounts response, or None if the request did not succeed.
+    """
+
+    return _get_json(f"https://api.github.com/users/{username}/social_accounts")
+
 # it looks like in most cases people do not list contributors in their readme files, so developing dedicated code for this
 # may not be a good use of time. 
 # def parseRepositoryReadme
-def search_github_user_for_orcid(username):
-    import re
-    import requests
-    user_url = f"https://api.github.com/users/{username}"
-    response = requests.get(user_url)
+def search_github_user_for_orcid(username, user_data=None):
+    # the caller can pass in the user's profile (from /users/{username}) if it has already been fetched
+    if user_data is None:
+        user_data = _user_json(username)
     
-    if response.status_code == 200:
-        user_data = response.json()
-        
-        # Search user data for ORCID-like strings
-        orcid_regex = r'\bhttps?://orcid\.org/\d{4}-\d{4}-\d{4}-\d{3}[0-9X]\b'
-        orcid_matches = re.findall(orcid_regex, str(user_data))
+    if user_data is not None:
+        # Search user data for ORCID-like strings, in the free-text fields where a user would put one
+        orcid_matches = [match for field in ("blog", "bio") for match in _ORCID_RE.findall(user_data.get(field) or "")]
         
         if orcid_matches:
             return orcid_matches
         
     # additionally, directly use the "social_accounts" API function to search for ORCID
-    social_accounts_url = f"https://api.github.com/users/{username}/social_accounts"
-    response = requests.get(social_accounts_url)
+    social_accounts_data = _social_accounts_json(username)
 
     # search this in the same fashion for an ORCID-like string
-    if response.status_code == 200:
-        social_accounts_data = response.json()
-        
-        # Search user data for ORCID-like strings
-        orcid_regex = r'\bhttps?://orcid\.org/\d{4}-\d{4}-\d{4}-\d{3}[0-9X]\b'
-        orcid_matches = re.findall(orcid_regex, str(social_accounts_data))
+    if social_accounts_data is not None:
+        # Search user data for ORCID-like strings, each account being a {"provider": ..., "url": ...} entry
+        orcid_matches = [
+            match for account in social_accounts_data if isinstance(account, dict)
+            for match in _ORCID_RE.findall(account.get("url") or "")
+        ]
         
         if orcid_matches:
             return orcid_matches
@@ -131,41 +524,64 @@ def search_github_user_for_orcid(username):
 # to search for a match.
 
 # first we have to get the name and institution from the GitHub API
-def get_name_and_institution_from_github_api(username):
-    import requests
-    user_url = f"https://api.github.com/users/{username}"
-    response = requests.get(user_url)
+def get_name_and_institution_from_github_api(username, user_data=None):
+    # as above, the user's profile can be passed in if it has already been fetched
+    if user_data is None:
+        user_data = _user_json(username)
     
-    if response.status_code == 200:
-        user_data = response.json()
-        
+    if user_data is not None:
         # Search user data for ORCID-like strings
         name = user_data.get("name")
         institution = user_data.get("company")
         
         return name, institution
 
+def _affiliation_matches(affiliation, institution):
+    """
+    This function checks whether an affiliation listed on an ORCID record matches the institution given on GitHub,
+    either exactly or as an acronym (e.g. "IU" for "Indiana University").
+
+    Parameters
+    ----------
+    affiliation : str
+        The full name of the affiliation, as listed on ORCID.
+    institution : str
+        The institution, as listed on GitHub.
+
+    Returns
+    -------
+    is_match : bool
+        True if the affiliation matches the institution, False otherwise.
+    """
+
+    # For each affiliation, only check the capitalized letters
+    # This is because the API returns the full affiliation, which may include non-capitalized words
+    # We only want to check the capitalized words, as these are the ones that are likely to be acronyms
+    capitalized_affiliation = "".join([char for char in affiliation if char.isupper()])
+    # check to see if the capitalized letters match the affiliation
+    return capitalized_affiliation == institution or affiliation == institution
+
 # then we have to pipe this in to the ORCID API
 def search_orcid_individual(name, institution):
-    import time
+    # GitHub profiles frequently don't list a name or an institution.  Without a name there's nothing to search for,
+    # and without an institution none of the results below could ever be matched, so don't search at all.
+    if not name or not name.split() or not institution:
+        return None
 
     # we're going to have to try a sequence of different possibilities
     # we begin by trying to split the input name into first and last name
+    # (splitting on any whitespace, so that repeated or trailing spaces don't produce empty names)
 
-    first_name = name.split(" ")[0]
-    last_name = name.split(" ")[-1]
+    first_name = name.split()[0]
+    last_name = name.split()[-1]
 
     # next, we'll try the frist name, last name, and full affiliation, under the assumption that these are correct
     # the api fields for these are "given-names", "family-name", and "affiliation-org-name"
 
     search_url = f"https://pub.orcid.org/v3.0/search?q=given-names:{first_name}+AND+family-name:{last_name}+AND+affiliation-org-name:{institution}&rows=10"
-    headers = {
-        "Accept": "application/json"
-    }
-    response = requests.get(search_url, headers=headers)
+    search_results = _get_json(search_url)
     
-    if response.status_code == 200:
-        search_results = response.json()
+    if search_results is not None:
 
         # check to ensure that one and only one result was returned
         if search_results.get("num-found") == 1:
@@ -176,56 +592,137 @@ def search_orcid_individual(name, institution):
     # to see if the sequence of capital letters in the listed affiliations matches the acronym
     # if it does, we'll return that ORCID
     # if it doesn't, we'll return None
-    search_url = f"https://pub.orcid.org/v3.0/search?q=given-names:{first_name}+AND+family-name:{last_name}&rows=10"
-    headers = {
-        "Accept": "application/json"
-    }
-    response = requests.get(search_url, headers=headers)
+    # the expanded-search endpoint lists each result's affiliations ("institution-name") inline, which saves us from
+    # having to fetch the full record of every result just to read its affiliations
+    search_url = f"https://pub.orcid.org/v3.0/expanded-search/?q=given-names:{first_name}+AND+family-name:{last_name}&rows=10"
+    search_results = _get_json(search_url)
     
-    if response.status_code == 200:
-        search_results = response.json()
+    if search_results is not None:
 
         # unfortunately, we don't have any efficient way to narrow these down, so we just have to start iterating through them
         # TODO: if there are any more advanced ways to compare the input affiliation and the returned affiliations, this
         # would be a good place to implement them.  For example, fuzzy matching, synonomous organizations, cap insensitive, etc.
         
-        for result in search_results.get("result"):
-            # if the result returns too many results, we'll throw a warning indicaitng this and return none
-            if search_results.get("num-found") > 10:
-                print(f"Warning: {search_results.get('num-found')} results found for {first_name} {last_name} without affiliation. Returning None.")
-                return None
-            # we include a wait here to avoid overloading the API
-            time.sleep(0.5)
+        # if the result returns too many results, we'll throw a warning indicaitng this and return none
+        # (this only depends on the search as a whole, so check it once before looking at any of the results)
+        if search_results.get("num-found", 0) > ORCID_MAX_NAMESAKES:
+            print(f"Warning: {search_results.get('num-found')} results found for {first_name} {last_name} without affiliation. Returning None.")
+            return None
+
+        # note that "expanded-result" is null, rather than empty, when nothing is found
+        for result in search_results.get("expanded-result") or []:
             # check to see if the affiliation is an acronym
             # first get the ORCID
-            orcid = result.get("orcid-identifier").get("path")
-            # then use this to query the ORCID API for the full record
-            record_url = f"https://pub.orcid.org/v3.0/{orcid}"
-            headers = {
-                "Accept": "application/json"
-            }
-
-            record_response = requests.get(record_url, headers=headers)
-
-            if record_response.status_code == 200:
-
-                # get the affiliations from the record
-                affiliations = record_response.json().get("activities-summary").get("employments").get("employment-summary")
-                # iterate through the affiliations
-                for iAffiliation in affiliations:
-                    # For each affiliation, only check the capitalized letters
-                    # This is because the API returns the full affiliation, which may include non-capitalized words
-                    # We only want to check the capitalized words, as these are the ones that are likely to be acronyms
-                    capitalized_affiliation = "".join([char for char in iAffiliation.get("organization").get("name") if char.isupper()])
-                    # check to see if the capitalized letters match the affiliation
-                    if capitalized_affiliation == institution or iAffiliation == institution:
-                        # if they do, then this is likely our best guess as to the match, so return the full ORCID
-                        # be sure to format the ORCID correctly, orcid is currently just 'path'
-                        return f"https://orcid.org/{orcid}"
+            orcid = result.get("orcid-id")
+            # iterate through the affiliations
+            for iAffiliation in result.get("institution-name") or []:
+                # check to see if the affiliation (or its acronym) matches
+                if _affiliation_matches(iAffiliation, institution):
+                    # if they do, then this is likely our best guess as to the match, so return the full ORCID
+                    # be sure to format the ORCID correctly, orcid is currently just 'path'
+                    return f"https://orcid.org/{orcid}"
     # if we can't find anything for either a direct match to the name + affiliation, or the name + affiliation abbreviation, we
     # we should simply return none    
     return None
 
+def search_orcid_bulk(people):
+    """
+    This function searches the ORCID database for several people at once, combining up to ORCID_BULK_SEARCH_SIZE of
+    them into a single expanded search, rather than searching for each one individually.  A result is matched back to
+    a person by their first and last name, and accepted if one of its affiliations matches the person's institution
+    (in the same manner as search_orcid_individual).  People without both a name and an institution can't be told apart
+    from namesakes this way, and so are skipped.
+
+    Parameters
+    ----------
+    people : dict
+        A dictionary mapping an identifier for each person (e.g. their GitHub username) to a (name, institution) tuple.
+
+    Returns
+    -------
+    orcid_links : dict
+        A dictionary mapping the identifiers of the people for whom exactly one matching ORCID was found to their ORCID
+        links.  Anyone not matched (or matched ambiguously, or with too many namesakes to trust a match) is omitted, and
+        can be searched for individually.
+    """
+
+    # split each name into first and last, as in search_orcid_individual
+    searchable = {}
+    for key, (name, institution) in people.items():
+        if name and name.split() and institution:
+            searchable[key] = (name.split()[0], name.split()[-1], institution)
+
+    orcid_links = {}
+    keys = list(searchable)
+    for start in range(0, len(keys), ORCID_BULK_SEARCH_SIZE):
+        orcid_links.update(_search_orcid_batch(keys[start:start + ORCID_BULK_SEARCH_SIZE], searchable))
+
+    return orcid_links
+
+def _search_orcid_batch(batch, searchable):
+    """
+    This function runs a single combined ORCID search for a batch of people, for search_orcid_bulk.  If the search
+    finds more results than it can return, the batch is split in half and each half searched for again, so that one
+    very common name doesn't stop everyone else in the batch from being matched.
+
+    Parameters
+    ----------
+    batch : list
+        The identifiers of the people to search for.
+    searchable : dict
+        A dictionary mapping each identifier to a (first name, last name, institution) tuple.
+
+    Returns
+    -------
+    orcid_links : dict
+        A dictionary mapping the identifiers of the people who were matched unambiguously to their ORCID links.
+    """
+
+    # OR together a (first name AND last name) clause for everyone in the batch
+    query = " OR ".join(
+        f'(given-names:"{searchable[key][0]}" AND family-name:"{searchable[key][1]}")' for key in batch
+    )
+    search_url = f"https://pub.orcid.org/v3.0/expanded-search/?q={quote(query)}&rows=1000"
+    search_results = _get_json(search_url)
+    if search_results is None:
+        return {}
+
+    # if the search found more people than it returned, we can't tell whether a match is unambiguous, so split the batch
+    # and try again.  A single person with this many namesakes is far too common a name to match, so is left to the
+    # individual search.
+    results = search_results.get("expanded-result") or []
+    if search_results.get("num-found", 0) > len(results):
+        if len(batch) == 1:
+            return {}
+        middle = len(batch) // 2
+        orcid_links = _search_orcid_batch(batch[:middle], searchable)
+        orcid_links.update(_search_orcid_batch(batch[middle:], searchable))
+        return orcid_links
+
+    # collect the namesakes, and the matching ORCIDs, for each person in the batch
+    namesakes = {key: 0 for key in batch}
+    matches = {key: set() for key in batch}
+    for result in results:
+        given_names = (result.get("given-names") or "").split()
+        family_names = (result.get("family-names") or "").lower()
+        if not given_names:
+            continue
+        for key in batch:
+            first_name, last_name, institution = searchable[key]
+            if given_names[0].lower() != first_name.lower() or family_names != last_name.lower():
+                continue
+            namesakes[key] += 1
+            if any(_affiliation_matches(iAffiliation, institution) for iAffiliation in result.get("institution-name") or []):
+                matches[key].add(result.get("orcid-id"))
+
+    # only accept unambiguous matches, for names that aren't too common to trust (as in search_orcid_individual)
+    orcid_links = {}
+    for key, orcids in matches.items():
+        if len(orcids) == 1 and namesakes[key] <= ORCID_MAX_NAMESAKES:
+            orcid_links[key] = f"https://orcid.org/{orcids.pop()}"
+
+    return orcid_links
+
 def search_github_user_for_orcid_robust(username):
     """
     This function searches for an ORCID link in a GitHub user's profile.
@@ -244,36 +741,99 @@ def search_github_user_for_orcid_robust(username):
         The ORCID link, if found, or None if not found.
     """
     
+    # before doing anything over the network, check whether we've already resolved this user recently
+    if _has_fresh_orcid(username):
+        return _orcid_cache[username].get("orcid")
+
+    # note how many requests have failed so far, so that we can tell if any in this search do
+    failures_before = _failed_request_count
+
     # first use the GitHub API to verify that the user exists
-    import requests
-    user_url = f"https://api.github.com/users/{username}"
-    response = requests.get(user_url)
+    user_data = _user_json(username)
     # if the user does not exist, throw an error
-    if response.status_code != 200:
+    if user_data is None:
         raise ValueError(f"GitHub user {username} does not exist.")
     
     # if the user does exist, then we can proceed with the search
     # first, we'll search the user's profile for an ORCID link
-    orcid_links = search_github_user_for_orcid(username)
+    # the profile we just fetched is passed along, so that it doesn't have to be fetched again
+    orcid_links = search_github_user_for_orcid(username, user_data)
     # if the result is not None, and a list, then we'll return the first result
     # if is not None and a string, then we'll return the result
     if orcid_links is not None:
         if type(orcid_links) == list:
-            return orcid_links[0]
+            return _remember_orcid(username, orcid_links[0])
         elif type(orcid_links) == str:
-            return orcid_links
+            return _remember_orcid(username, orcid_links)
 
     # if we don't find one, then we'll try to search the ORCID database for a match
     # first, we'll get the user's name and affiliation
-    [name, affiliation] = get_name_and_institution_from_github_api(username)
+    [name, affiliation] = get_name_and_institution_from_github_api(username, user_data)
     # then we'll search the ORCID database for a match
     orcid_link = search_orcid_individual(name, affiliation)
     # if we find one, return it
     if orcid_link is not None:
-        return orcid_link
+        return _remember_orcid(username, orcid_link)
     # TODO: this is where we would add other search methods, such as scraping the HTML of the personal website list on GitHub
+    # only record that there is no ORCID if every request in the search succeeded, as otherwise the ORCID may simply
+    # have been missed, and should be searched for again next time
+    if _failed_request_count == failures_before:
+        return _remember_orcid(username, None)
     return None
 
+def add_orcids_to_contributors(contributors):
+    """
+    This function looks up the ORCID of each contributor (as returned by get_repository_contributors), and adds it
+    to the contributor's entry under "orcid".  Each distinct login is only resolved once, even if it appears several
+    times in the input.
+
+    Parameters
+    ----------
+    contributors : list of dict
+        The contributors, each with (at least) a "login" entry.
+
+    Returns
+    -------
+    contributors : list of dict
+        The same contributors, each with an added "orcid" entry (None if no ORCID could be found).
+    """
+
+    # collapse the contributors down to the distinct logins first, so that no one is searched for twice
+    unique_contributors = {contributor["login"]: contributor for contributor in contributors if contributor.get("login")}
+
+    # for anyone we haven't already resolved, and who doesn't list an ORCID on their profile, gather their name and
+    # institution so that they can all be searched for together, rather than one ORCID search per contributor
+    # (the profile lookups here are memoized, so they aren't repeated by search_github_user_for_orcid_robust below)
+    people = {}
+    for login in unique_contributors:
+        if _has_fresh_orcid(login):
+            continue
+        user_data = _user_json(login)
+        if user_data is None or search_github_user_for_orcid(login, user_data) is not None:
+            continue
+        people[login] = get_name_and_institution_from_github_api(login, user_data)
+
+    # searching for a single person this way would gain nothing over the individual search
+    if len(people) > 1:
+        for login, orcid_link in search_orcid_bulk(people).items():
+            _remember_orcid(login, orcid_link)
+
+    # everyone else (including anyone the combined search couldn't match) goes through the usual search
+    orcid_map = {}
+    for login in unique_contributors:
+        try:
+            orcid_map[login] = search_github_user_for_orcid_robust(login)
+        except ValueError:
+            # the profile couldn't be fetched (e.g. a deleted account, or a rate limited or failed request), so this
+            # contributor is left without an ORCID, rather than losing the results for everyone else
+            orcid_map[login] = None
+
+    # then join the results back on to every entry
+    for contributor in contributors:
+        contributor["orcid"] = orcid_map.get(contributor.get("login"))
+
+    return contributors
+
 # here we test the search_github_user_for_orcid_robust function
 # using francopestilli, who does not (as of 05/18/2023) have an ORCID listed in their GitHub profile
 # though his ORCID is known to be https://orcid.org/0000-0002-2469-0494
@@ -298,10 +858,6 @@ def test_search_github_user_for_orcid_robust():
 
 
 
-import unittest
-from unittest.mock import patch
-
-
 class TestGithubProfileOrcidSearch(unittest.TestCase):
 
        def test_search_github_user_for_orcid(self):
@@ -313,6 +869,239 @@ class TestGithubProfileOrcidSearch(unittest.TestCase):
         expected_orcid_link = "https://orcid.org/0000-0002-4321-2180"
         self.assertIn(expected_orcid_link, orcid_links)    
 
+       def test_search_orcid_bulk(self):
+        # Mock a combined search returning one person at the right institution (by acronym), and one at the wrong one
+        search_results = {
+            "num-found": 2,
+            "expanded-result": [
+                {"orcid-id": "0000-0000-0000-0001", "given-names": "Jo", "family-names": "Bloggs",
+                 "institution-name": ["Indiana University"]},
+                {"orcid-id": "0000-0000-0000-0002", "given-names": "Ann", "family-names": "Lee",
+                 "institution-name": ["Stanford University"]}
+            ]
+        }
+        people = {"jo": ("Jo Bloggs", "IU"), "ann": ("Ann Lee", "MIT")}
+        with patch.object(sys.modules[__name__], "_get_json", return_value=search_results) as get_json:
+            orcid_links = search_orcid_bulk(people)
+
+        # Assert both people were searched for in one request, and only the affiliation match was accepted
+        self.assertEqual(get_json.call_count, 1)
+        self.assertEqual(orcid_links, {"jo": "https://orcid.org/0000-0000-0000-0001"})
+
+       def test_search_orcid_bulk_truncated_results(self):
+        # Mock searches in which John Smith has far more namesakes than can be returned (one of whom looks like a
+        # match), so that any search including him is cut short, while Jo Bloggs and Ann Lee each have one result
+        john_smith = {"orcid-id": "0000-0000-0000-0001", "given-names": "John", "family-names": "Smith",
+                      "institution-name": ["Massachusetts Institute of Technology"]}
+        jo_bloggs = {"orcid-id": "0000-0000-0000-0002", "given-names": "Jo", "family-names": "Bloggs",
+                     "institution-name": ["Indiana University"]}
+        ann_lee = {"orcid-id": "0000-0000-0000-0003", "given-names": "Ann", "family-names": "Lee",
+                   "institution-name": ["Stanford University"]}
+
+        def get_json(url):
+            query = unquote(url)
+            if '"Smith"' in query:
+                return {"num-found": 5000, "expanded-result": [john_smith]}
+            results = [result for result in (jo_bloggs, ann_lee) if f'"{result["family-names"]}"' in query]
+            return {"num-found": len(results), "expanded-result": results}
+
+        people = {"john": ("John Smith", "MIT"), "jo": ("Jo Bloggs", "IU"), "ann": ("Ann Lee", "SU")}
+        with patch.object(sys.modules[__name__], "_get_json", side_effect=get_json) as mocked_get_json:
+            orcid_links = search_orcid_bulk(people)
+
+        # Assert the truncated batch was split in half (John Smith, then Jo Bloggs and Ann Lee together), so that
+        # everyone but John Smith (whose match can't be known to be unambiguous) was still matched
+        self.assertEqual(orcid_links, {
+            "jo": "https://orcid.org/0000-0000-0000-0002",
+            "ann": "https://orcid.org/0000-0000-0000-0003"
+        })
+        self.assertEqual(mocked_get_json.call_count, 3)
+
+       def test_search_orcid_bulk_ambiguous_results(self):
+        # Mock a search in which two people with the same name are at the same institution
+        namesake = {"given-names": "Jo", "family-names": "Bloggs", "institution-name": ["Indiana University"]}
+        search_results = {
+            "num-found": 2,
+            "expanded-result": [
+                dict(namesake, **{"orcid-id": "0000-0000-0000-0001"}),
+                dict(namesake, **{"orcid-id": "0000-0000-0000-0002"})
+            ]
+        }
+        with patch.object(sys.modules[__name__], "_get_json", return_value=search_results):
+            orcid_links = search_orcid_bulk({"jo": ("Jo Bloggs", "IU"), "ann": ("Ann Lee", "MIT")})
+
+        # Assert neither is accepted
+        self.assertEqual(orcid_links, {})
+
+       def test_search_orcid_bulk_common_name(self):
+        # Mock a search returning more namesakes than search_orcid_individual would accept, only one at the institution
+        search_results = {
+            "num-found": ORCID_MAX_NAMESAKES + 1,
+            "expanded-result": [
+                {"orcid-id": f"0000-0000-0000-{i:04d}", "given-names": "John", "family-names": "Smith",
+                 "institution-name": ["Massachusetts Institute of Technology" if i == 0 else "Elsewhere"]}
+                for i in range(ORCID_MAX_NAMESAKES + 1)
+            ]
+        }
+        with patch.object(sys.modules[__name__], "_get_json", return_value=search_results):
+            orcid_links = search_orcid_bulk({"john": ("John Smith", "MIT"), "jo": ("Jo Bloggs", "IU")})
+
+        # Assert the name is treated as too common to trust the match
+        self.assertEqual(orcid_links, {})
+
+       def _mock_response(self, status_code, headers, body=None):
+        # Build a stand-in for a requests.Response with the given status, headers and (JSON) body
+        response = Mock()
+        response.status_code = status_code
+        response.headers = headers
+        response.content = json.dumps(body).encode()
+        return response
+
+       def test_rate_limited_get_retries_after_429(self):
+        # Mock a 429 asking us to wait 5 seconds, followed by a success
+        responses = [self._mock_response(429, {"Retry-After": "5"}), self._mock_response(200, {})]
+        with patch.object(_SESSION, "get", side_effect=responses) as get, patch.object(time, "sleep") as sleep:
+            response = _rate_limited_get("https://pub.orcid.org/v3.0/search")
+
+        # Assert the request was retried once, after the requested wait
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(get.call_count, 2)
+        sleep.assert_called_once_with(5)
+
+       def test_rate_limited_get_retries_after_exhausted_github_limit(self):
+        # Mock GitHub's exhausted rate limit (a 403 with none remaining), resetting in 30 seconds, followed by a success
+        reset = str(int(time.time()) + 30)
+        responses = [
+            self._mock_response(403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset}),
+            self._mock_response(200, {"X-RateLimit-Remaining": "4999", "X-RateLimit-Reset": reset})
+        ]
+        with patch.object(_SESSION, "get", side_effect=responses) as get, patch.object(time, "sleep") as sleep:
+            response = _rate_limited_get("https://api.github.com/users/DanNBullock")
+
+        # Assert the request was retried once, after waiting (about) until the reset
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(get.call_count, 2)
+        self.assertEqual(sleep.call_count, 1)
+        self.assertTrue(0 < sleep.call_args[0][0] <= 30)
+
+       def test_rate_limited_get_retries_after_secondary_rate_limit(self):
+        # Mock GitHub's secondary rate limit (a 403 with "Retry-After", while requests remain), followed by a success
+        responses = [
+            self._mock_response(403, {"Retry-After": "60", "X-RateLimit-Remaining": "4000"}),
+            self._mock_response(200, {"X-RateLimit-Remaining": "3999"})
+        ]
+        with patch.object(_SESSION, "get", side_effect=responses) as get, patch.object(time, "sleep") as sleep:
+            response = _rate_limited_get("https://api.github.com/users/DanNBullock")
+
+        # Assert the request was retried once, after the requested wait
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(get.call_count, 2)
+        sleep.assert_called_once_with(60)
+
+       def test_rate_limited_get_waits_when_nearly_out(self):
+        # Mock a success with fewer requests remaining than RATE_LIMIT_LOW_WATER
+        reset = str(int(time.time()) + 30)
+        responses = [self._mock_response(200, {"X-RateLimit-Remaining": "3", "X-RateLimit-Reset": reset})]
+        with patch.object(_SESSION, "get", side_effect=responses) as get, patch.object(time, "sleep") as sleep:
+            response = _rate_limited_get("https://api.github.com/users/DanNBullock")
+
+        # Assert the response is returned without a retry, but only after waiting for the reset
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(get.call_count, 1)
+        self.assertEqual(sleep.call_count, 1)
+        self.assertTrue(0 < sleep.call_args[0][0] <= 30)
+
+       def test_rate_limited_get_no_wait_with_headroom(self):
+        # Mock a success with plenty of requests remaining
+        responses = [self._mock_response(200, {"X-RateLimit-Remaining": "4999"})]
+        with patch.object(_SESSION, "get", side_effect=responses), patch.object(time, "sleep") as sleep:
+            _rate_limited_get("https://api.github.com/users/DanNBullock")
+
+        # Assert there was no wait at all
+        sleep.assert_not_called()
+
+       def test_get_json_revalidates_with_etag(self):
+        # Mock a response with an ETag, followed (once the in-memory copy has gone stale) by a "304 Not Modified"
+        url = "https://api.github.com/users/DanNBullock"
+        responses = [
+            self._mock_response(200, {"ETag": '"abc"'}, {"login": "DanNBullock"}),
+            self._mock_response(304, {})
+        ]
+        clock = [1000.0]
+        module = sys.modules[__name__]
+        # use a fresh, in-memory ETag store and response cache
+        with patch.object(module, "ETAG_CACHE_PATH", ":memory:"), patch.object(module, "_etag_store", None), \
+                patch.dict(_response_cache, clear=True), patch.object(_SESSION, "get", side_effect=responses) as get, \
+                patch.object(time, "time", side_effect=lambda: clock[0]):
+            first = _get_json(url)
+            clock[0] += GITHUB_CACHE_TTL + 1
+            second = _get_json(url)
+            stored_at = _get_etag_store().execute("SELECT stored_at FROM etags WHERE url = ?", (url,)).fetchone()[0]
+
+        # Assert the ETag was sent back, the stored body reused, and the entry's timestamp refreshed
+        self.assertEqual(get.call_count, 2)
+        self.assertNotIn("If-None-Match", get.call_args_list[0][1]["headers"])
+        self.assertEqual(get.call_args_list[1][1]["headers"]["If-None-Match"], '"abc"')
+        self.assertEqual(first, {"login": "DanNBullock"})
+        self.assertEqual(second, {"login": "DanNBullock"})
+        self.assertEqual(stored_at, clock[0])
+
+       def _mock_orcid_search(self, orcid_status):
+        # Build a mocked session for a user without an ORCID on their profile, whose ORCID searches return orcid_status
+        # (with no results, when successful)
+        def get(url, headers=None):
+            if url.endswith("/social_accounts"):
+                return self._mock_response(200, {}, [])
+            if url.startswith("https://api.github.com/users/"):
+                return self._mock_response(200, {}, {"name": "Jo Bloggs", "company": "IU"})
+            return self._mock_response(orcid_status, {}, {"num-found": 0, "result": None, "expanded-result": None})
+        return get
+
+       def _isolate_caches(self):
+        # Patch in empty response and ORCID caches, with no ETag store, and without writing the ORCID cache at exit,
+        # for the rest of the test
+        module = sys.modules[__name__]
+        for cache_patch in [
+            patch.dict(_response_cache, clear=True),
+            patch.dict(_orcid_cache, clear=True),
+            patch.object(module, "_orcid_cache_modified", False),
+            patch.object(module, "_etag_store", False)
+        ]:
+            cache_patch.start()
+            self.addCleanup(cache_patch.stop)
+
+       def test_robust_search_does_not_remember_failed_search(self):
+        # Mock an ORCID API which is unavailable
+        self._isolate_caches()
+        with patch.object(_SESSION, "get", side_effect=self._mock_orcid_search(503)):
+            orcid_link = search_github_user_for_orcid_robust("jobloggs")
+
+        # Assert nothing was found, and that this wasn't recorded, so the user is searched for again next time
+        self.assertIsNone(orcid_link)
+        self.assertNotIn("jobloggs", _orcid_cache)
+
+       def test_robust_search_remembers_clean_miss(self):
+        # Mock an ORCID API which works, but finds no one
+        self._isolate_caches()
+        with patch.object(_SESSION, "get", side_effect=self._mock_orcid_search(200)):
+            orcid_link = search_github_user_for_orcid_robust("jobloggs")
+
+        # Assert the lack of an ORCID was recorded
+        self.assertIsNone(orcid_link)
+        self.assertIn("jobloggs", _orcid_cache)
+        self.assertIsNone(_orcid_cache["jobloggs"]["orcid"])
+
+       def test_robust_search_uses_fresh_cache_entry(self):
+        # Start with a recently resolved ORCID in the cache
+        self._isolate_caches()
+        _orcid_cache["jobloggs"] = {"orcid": "https://orcid.org/0000-0000-0000-0001", "resolved_at": time.time()}
+        with patch.object(_SESSION, "get") as get:
+            orcid_link = search_github_user_for_orcid_robust("jobloggs")
+
+        # Assert the cached ORCID was returned without any requests
+        self.assertEqual(orcid_link, "https://orcid.org/0000-0000-0000-0001")
+        get.assert_not_called()
+
 if __name__ == '__main__':
     unittest.main()
 